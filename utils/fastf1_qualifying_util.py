@@ -1,43 +1,141 @@
+import os
+
+import matplotlib
+
+# Render with the non-interactive Agg backend when generating plots in batch
+if os.environ.get('FASTF1_HEADLESS') == '1':
+    matplotlib.use('Agg')
+
 import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.lines import Line2D
+
+# Rendering settings for the dense telemetry lines in plot_telemetry
+_TELEMETRY_RC_PARAMS = {
+    'path.simplify': True,
+    'path.simplify_threshold': 1.0,
+}
+
+# Telemetry column of each subplot in plot_telemetry, from top to bottom
+_TELEMETRY_CHANNELS = ['Speed', 'Throttle', 'Brake', 'nGear', 'RPM', 'DRS']
+
+
+def _lttb(x, y, max_points):
+    """
+    Downsample a series with the Largest-Triangle-Three-Buckets algorithm.
+
+    Args:
+        x: array of x values, sorted in ascending order
+        y: array of y values
+        max_points: number of points to keep, None keeps every point
 
-def plot_telemetry(session, driver_abbrs):
+    Returns:
+        Tuple of the downsampled x and y arrays
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    if max_points is None or max_points < 3 or n <= max_points:
+        return x, y
+
+    # The first and last points are always kept, the rest is split into max_points - 2 buckets
+    edges = np.linspace(1, n - 1, max_points - 1).astype(int)
+    selected = np.empty(max_points, dtype=int)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    prev = 0
+    for i in range(max_points - 2):
+        start, end = edges[i], edges[i + 1]
+
+        # Average point of the next bucket, or the last point for the final bucket
+        if i + 2 < len(edges):
+            next_start, next_end = edges[i + 1], edges[i + 2]
+        else:
+            next_start, next_end = n - 1, n
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+
+        # Keep the point forming the largest triangle with the previous point and the next average
+        areas = np.abs((x[prev] - avg_x) * (y[start:end] - y[prev])
+                       - (x[prev] - x[start:end]) * (avg_y - y[prev]))
+        prev = start + int(np.argmax(areas))
+        selected[i + 1] = prev
+
+    return x[selected], y[selected]
+
+
+def plot_telemetry(session, driver_abbrs, max_points=2000, axes=None, save_path=None):
     """
     Plot telemetry data (Speed, Throttle, Brake, Gear, RPM, DRS) for given drivers in a session.
 
     Args:
         session: fastf1.Session object (loaded)
         driver_abbrs: list of driver abbreviations, e.g. ['NOR', 'PIA', 'VER']
+        max_points: maximum number of points plotted per channel, downsampled with LTTB (None plots every point)
+        axes: sequence of 6 matplotlib Axes to draw on, cleared before plotting (None creates a new figure and displays it)
+        save_path: file to save the figure to at 100 dpi instead of displaying it, a figure created here is closed
+            afterwards (None displays the figure)
     """
+    # Filter the laps once and pick each driver's fastest lap in a single groupby
+    laps = session.laps.pick_drivers(driver_abbrs)
+    # Like pick_fastest(), only personal best laps count, which excludes deleted laps
+    personal_bests = laps[laps['IsPersonalBest'] == True]
+    fastest_idx = personal_bests.groupby('Driver')['LapTime'].idxmin()
+
+    # Drivers may be given as abbreviations or driver numbers, as accepted by pick_drivers()
+    driver_ids = laps[['Driver', 'DriverNumber']].drop_duplicates()
+    abbreviations = dict(zip(driver_ids['Driver'], driver_ids['Driver']))
+    abbreviations.update(zip(driver_ids['DriverNumber'], driver_ids['Driver']))
+
     telemetry = []
     for driver in driver_abbrs:
-        lap = session.laps.pick_drivers(driver).pick_fastest()
-        telemetry.append(lap.get_telemetry())
-
-    fig, axes = plt.subplots(6, 1, figsize=(12, 12), sharex=True)
-
-    # You can customize colors or use a default set here
-    default_colors = ['orange', 'red', 'blue', 'green', 'purple', 'brown']
-    driver_colors = {d: default_colors[i % len(default_colors)] for i, d in enumerate(driver_abbrs)}
-
-    for driver_data, driver_name in zip(telemetry, driver_abbrs):
-        axes[0].plot(driver_data['Distance'], driver_data['Speed'], label=f"{driver_name} Speed (km/h)", color=driver_colors[driver_name])
-        axes[1].plot(driver_data['Distance'], driver_data['Throttle'], label=f"{driver_name} Throttle (%)", color=driver_colors[driver_name])
-        axes[2].plot(driver_data['Distance'], driver_data['Brake'], label=f"{driver_name} Brake", color=driver_colors[driver_name])
-        axes[3].plot(driver_data['Distance'], driver_data['nGear'], label=f"{driver_name} Gear", color=driver_colors[driver_name])
-        axes[4].plot(driver_data['Distance'], driver_data['RPM'], label=f"{driver_name} RPM", color=driver_colors[driver_name])
-        axes[5].plot(driver_data['Distance'], driver_data['DRS'], label=f"{driver_name} DRS (1=Active, 0=Off)", color=driver_colors[driver_name])
-
-    for ax in axes:
-        ax.legend()
-        ax.grid()
-
-    axes[0].set_ylabel("Speed (km/h)")
-    axes[1].set_ylabel("Throttle (%)")
-    axes[2].set_ylabel("Brake")
-    axes[3].set_ylabel("Gear")
-    axes[4].set_ylabel("RPM")
-    axes[5].set_ylabel("DRS")
-    axes[5].set_xlabel("Distance (m)")
-
-    plt.suptitle(f"Q3 Top Drivers Fastest Lap Telemetry Data ({session.event['EventName']} {session.event.year})")
-    plt.show()
+        abbreviation = abbreviations.get(str(driver))
+        if abbreviation not in fastest_idx:
+            raise ValueError(f"No personal best lap found for driver {driver!r}")
+
+        lap = laps.loc[fastest_idx[abbreviation]]
+        lap_telemetry = lap.get_telemetry()
+        # Keep only the plotted columns, each as its own contiguous NumPy array
+        telemetry.append({column: lap_telemetry[column].to_numpy() for column in ['Distance'] + _TELEMETRY_CHANNELS})
+
+    # Simplify the long telemetry paths, the settings are captured when each line creates its path
+    with plt.rc_context(_TELEMETRY_RC_PARAMS):
+        show = axes is None
+        if show:
+            fig, axes = plt.subplots(6, 1, figsize=(12, 12), sharex=True)
+        else:
+            fig = axes[0].figure
+            for ax in axes:
+                ax.clear()
+
+        # You can customize colors or use a default set here
+        default_colors = ['orange', 'red', 'blue', 'green', 'purple', 'brown']
+        driver_colors = {d: default_colors[i % len(default_colors)] for i, d in enumerate(driver_abbrs)}
+
+        # Draw each channel as one rasterized Line2D per driver, without per-line labels
+        for ax, channel in zip(axes, _TELEMETRY_CHANNELS):
+            for driver_data, driver_name in zip(telemetry, driver_abbrs):
+                ax.plot(*_lttb(driver_data['Distance'], driver_data[channel], max_points),
+                        color=driver_colors[driver_name], rasterized=True)
+            ax.grid()
+
+        # Every subplot shows the same drivers, so a single legend built from proxy artists is enough
+        handles = [Line2D([], [], color=driver_colors[driver_name], label=driver_name) for driver_name in driver_abbrs]
+        axes[0].legend(handles=handles, loc='upper right')
+
+        axes[0].set_ylabel("Speed (km/h)")
+        axes[1].set_ylabel("Throttle (%)")
+        axes[2].set_ylabel("Brake")
+        axes[3].set_ylabel("Gear")
+        axes[4].set_ylabel("RPM")
+        axes[5].set_ylabel("DRS (1=Active, 0=Off)")
+        axes[5].set_xlabel("Distance (m)")
+
+        fig.suptitle(f"Q3 Top Drivers Fastest Lap Telemetry Data ({session.event['EventName']} {session.event.year})")
+        if save_path is not None:
+            fig.savefig(save_path, dpi=100)
+            if show:
+                plt.close(fig)  # Release the figure created here so batch runs don't accumulate open figures
+        elif show:
+            plt.show()
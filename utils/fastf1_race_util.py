@@ -1,8 +1,69 @@
+import hashlib
+import json
+import os
+
+import matplotlib
+
+# Render with the non-interactive Agg backend when generating plots in batch
+if os.environ.get('FASTF1_HEADLESS') == '1':
+    matplotlib.use('Agg')
+
 import matplotlib.pyplot as plt
 import seaborn as sns
 import pandas as pd
+import numpy as np
+
+
+def _prepare_axes(ax, figsize):
+    """
+    Returns the figure and axes to plot on, reusing and clearing the given axes if there is one.
+
+    Parameters:
+    - ax: matplotlib Axes to reuse, or None to create a new figure
+    - figsize: tuple, the size of the figure created when ax is None
+
+    Returns:
+    - Tuple of the figure, the axes and whether the plot should be displayed with plt.show()
+    """
+    if ax is None:
+        fig, ax = plt.subplots(figsize=figsize)
+        return fig, ax, True
+
+    ax.clear()
+    return ax.figure, ax, False
+
+
+def _as_soa(df, columns):
+    """
+    Extracts DataFrame columns once as NumPy arrays.
+
+    Parameters:
+    - df: DataFrame to read from
+    - columns: list of column names
+
+    Returns:
+    - dict mapping each column name to its values as a NumPy array
+    """
+    return {column: df[column].to_numpy() for column in columns}
+
+
+def _driver_rows(drivers):
+    """
+    Groups the row positions of a driver column by driver.
+
+    Parameters:
+    - drivers: Series of driver identifiers, one per row
+
+    Returns:
+    - dict mapping each driver, in order of first appearance, to the integer positions of its rows
+    """
+    codes, uniques = pd.factorize(drivers)
+    order = np.argsort(codes, kind='stable')  # Rows without a driver (code -1) sort first and are skipped
+    bounds = np.searchsorted(codes[order], np.arange(len(uniques) + 1))
+    return {driver: order[bounds[i]:bounds[i + 1]] for i, driver in enumerate(uniques)}
+
 
-def plot_laptimes_boxplot(data, x, y, hue, order, palette, figsize=(15, 10), xlabel=None, title=None):
+def plot_laptimes_boxplot(data, x, y, hue, order, palette, figsize=(15, 10), xlabel=None, title=None, ax=None):
     """
     Plot a boxplot of lap times.
 
@@ -16,12 +77,13 @@ def plot_laptimes_boxplot(data, x, y, hue, order, palette, figsize=(15, 10), xla
     - figsize: tuple, the size of the figure (default: (15, 10))
     - xlabel: str, the label for the x-axis (default: None)
     - title: str, the title of the plot (default: None)
+    - ax: matplotlib Axes to draw on, cleared before plotting (default: None, creates a new figure and displays it)
 
     Returns:
     - None: Displays the plot.
     """
 
-    fig, ax = plt.subplots(figsize=figsize)
+    fig, ax, show = _prepare_axes(ax, figsize)
     sns.boxplot(
         data=data,
         x=x,
@@ -33,9 +95,10 @@ def plot_laptimes_boxplot(data, x, y, hue, order, palette, figsize=(15, 10), xla
         boxprops=dict(edgecolor="white"),
         medianprops=dict(color="grey"),
         capprops=dict(color="white"),
+        ax=ax,
     )
 
-    plt.grid(visible=False)
+    ax.grid(visible=False)
 
     if xlabel:
         ax.set(xlabel=xlabel)
@@ -43,13 +106,14 @@ def plot_laptimes_boxplot(data, x, y, hue, order, palette, figsize=(15, 10), xla
         ax.set(xlabel=None)
 
     if title:
-        plt.title(title)
+        ax.set_title(title)
 
-    plt.tight_layout()
-    plt.show()
+    fig.tight_layout()
+    if show:
+        plt.show()
 
 
-def plot_lap_time_distributions(driver_laps, finishing_order, driver_colors, compound_colors, title=None, marker_size = 4, figsize=(10, 5)):
+def plot_lap_time_distributions(driver_laps, finishing_order, driver_colors, compound_colors, title=None, marker_size = 4, figsize=(10, 5), jitter=0.2, seed=0, ax=None):
     """
     Utility function to plot lap time distributions for each driver.
     
@@ -61,6 +125,9 @@ def plot_lap_time_distributions(driver_laps, finishing_order, driver_colors, com
     - title: str, the title of the plot (default: None)
     - marker_size: float, size of the markers (default: 4)
     - figsize: tuple, the size of the figure (default: (10, 5))
+    - jitter: float, maximum horizontal offset of the markers from the driver position (default: 0.2)
+    - seed: int, seed of the random jitter so repeated plots place the markers identically (default: 0)
+    - ax: matplotlib Axes to draw on, cleared before plotting (default: None, creates a new figure and displays it)
     
     Returns:
     - None: Displays the plot.
@@ -70,7 +137,7 @@ def plot_lap_time_distributions(driver_laps, finishing_order, driver_colors, com
         driver_laps["LapTime (s)"] = driver_laps["LapTime"].dt.total_seconds()
 
     # Create the figure
-    fig, ax = plt.subplots(figsize=figsize)
+    fig, ax, show = _prepare_axes(ax, figsize)
 
     # Violin plot
     sns.violinplot(data=driver_laps,
@@ -80,33 +147,158 @@ def plot_lap_time_distributions(driver_laps, finishing_order, driver_colors, com
                    inner=None,
                    density_norm="area",
                    order=finishing_order,
-                   palette=driver_colors
+                   palette=driver_colors,
+                   ax=ax
                    )
 
-    # Swarm plot
-    sns.swarmplot(data=driver_laps,
-                  x="Driver",
-                  y="LapTime (s)",
-                  order=finishing_order,
-                  hue="Compound",
-                  palette=compound_colors,
-                  hue_order=["SOFT", "MEDIUM", "HARD"],
-                  linewidth=0,
-                  size=marker_size,
-                  )
+    # Jittered scatter of the individual laps, one call per compound
+    x_positions = {driver: i for i, driver in enumerate(finishing_order)}
+    x = driver_laps["Driver"].map(x_positions).to_numpy(dtype=float)
+    x = x + np.random.default_rng(seed).uniform(-jitter, jitter, len(x))
+    y = driver_laps["LapTime (s)"].to_numpy()
+    compounds = driver_laps["Compound"].to_numpy()
+
+    for compound in ["SOFT", "MEDIUM", "HARD"]:
+        idx = np.flatnonzero((compounds == compound) & ~np.isnan(x))  # Drivers outside finishing_order are skipped
+        ax.scatter(x[idx],
+                   y[idx],
+                   color=compound_colors.get(compound, 'gray'),
+                   s=marker_size ** 2,
+                   linewidths=0,
+                   label=compound,
+                   zorder=3,
+                   )
+    ax.legend(title="Compound")
 
     # Customize labels and title
     ax.set_xlabel("Driver")
     ax.set_ylabel("Lap Time (s)")
     if title:
-        plt.suptitle(title)
-    sns.despine(left=True, bottom=True)
+        fig.suptitle(title)
+    sns.despine(ax=ax, left=True, bottom=True)
+
+    fig.tight_layout()
+    if show:
+        plt.show()
+
+
+# Known tyre compounds, from softest to wettest
+_COMPOUND_ORDER = ['SOFT', 'MEDIUM', 'HARD', 'INTERMEDIATE', 'WET']
+
+# Attribute holding the Line2D handles and blitting state on the axes passed to plot_driver_positions,
+# so the state is released together with the figure
+_POSITION_ARTISTS_ATTR = '_fastf1_position_artists'
+
+
+def _position_artists(ax):
+    """
+    Returns the cached position lines and blitting state of an axes, if they are still drawn on it.
+
+    Parameters:
+    - ax: matplotlib Axes that may have been passed to plot_driver_positions
+
+    Returns:
+    - dict with the lines, background, blit flag and draw event callback id, or None
+    """
+    cache = getattr(ax, _POSITION_ARTISTS_ATTR, None)
+    if cache is None:
+        return None
+
+    # ax.clear() from another plot detaches the lines, after which the cache is stale
+    if any(line.axes is not ax for line in cache['lines'].values()):
+        _forget_position_artists(ax)
+        return None
+    return cache
+
+
+def _draw_position_lines(ax):
+    """
+    Redraws only the cached position lines of an axes on top of its saved background.
+
+    Parameters:
+    - ax: matplotlib Axes previously passed to plot_driver_positions
+    """
+    cache = _position_artists(ax)
+    canvas = ax.figure.canvas
+
+    canvas.restore_region(cache['background'])
+    for line in cache['lines'].values():
+        ax.draw_artist(line)
+    canvas.blit(ax.bbox)
+    canvas.flush_events()
+
+
+def _on_position_draw(ax, event):
+    """
+    Draw event callback that saves the background of the axes after a full redraw.
+
+    Parameters:
+    - ax: matplotlib Axes previously passed to plot_driver_positions
+    - event: matplotlib DrawEvent of the full redraw
+    """
+    cache = _position_artists(ax)
+    if cache is None:
+        return
+
+    # The lines are animated, so the full redraw leaves them out of the saved background.
+    # Vector canvases used by savefig cannot save a background, but still need the lines drawn.
+    if event.canvas.supports_blit:
+        cache['background'] = event.canvas.copy_from_bbox(ax.bbox)
+    for line in cache['lines'].values():
+        line.draw(event.renderer)
+
+
+def _forget_position_artists(ax):
+    """
+    Drops the cached position lines of an axes and disconnects its draw event callback.
+
+    Parameters:
+    - ax: matplotlib Axes that may have been passed to plot_driver_positions
+    """
+    cache = ax.__dict__.pop(_POSITION_ARTISTS_ATTR, None)
+    if cache is not None and cache['draw_cid'] is not None:
+        ax.figure.canvas.mpl_disconnect(cache['draw_cid'])
 
-    plt.tight_layout()
-    plt.show()
 
+def _update_driver_positions(ax, lap_data, driver_colors):
+    """
+    Updates the position lines of an axes in place, redrawing them with blitting when possible.
 
-def plot_driver_positions(lap_data, driver_colors, title="Race Position Changes", figsize=(8.0, 4.9)):
+    Parameters:
+    - ax: matplotlib Axes previously passed to plot_driver_positions
+    - lap_data: DataFrame containing the lap data for drivers, expected to have columns 'Driver', 'LapNumber', and 'Position'
+    - driver_colors: dict, mapping of driver identifiers to colors
+    """
+    cache = _position_artists(ax)
+    lines = cache['lines']
+    full_redraw = not cache['blit']
+
+    columns = _as_soa(lap_data, ['LapNumber', 'Position'])
+    for driver, rows in _driver_rows(lap_data['Driver']).items():
+        lap_numbers, positions = columns['LapNumber'][rows], columns['Position'][rows]
+
+        if driver in lines:
+            lines[driver].set_data(lap_numbers, positions)
+        else:
+            color = driver_colors.get(driver, 'black')  # Use black as default if no color is specified
+            lines[driver], = ax.plot(lap_numbers, positions, label=driver, color=color, animated=cache['blit'])
+            ax.legend(handles=list(lines.values()), bbox_to_anchor=(1.05, 1), loc='upper left')
+            full_redraw = True
+
+    # Extend the x-axis when new laps are added beyond the current limits
+    xlim = ax.get_xlim()
+    ax.relim()
+    ax.autoscale_view(scaley=False)
+    if ax.get_xlim() != xlim:
+        full_redraw = True
+
+    if full_redraw:
+        ax.figure.canvas.draw_idle()
+    else:
+        _draw_position_lines(ax)
+
+
+def plot_driver_positions(lap_data, driver_colors, title="Race Position Changes", figsize=(8.0, 4.9), ax=None):
     """
     Plots the race position changes for each driver in a session.
 
@@ -115,19 +307,27 @@ def plot_driver_positions(lap_data, driver_colors, title="Race Position Changes"
     - driver_colors: dict, mapping of driver identifiers to colors
     - title: str, the title of the plot (default: "Race Position Changes")
     - figsize: tuple, the size of the figure (default: (8.0, 4.9))
+    - ax: matplotlib Axes to draw on, cleared on the first call (default: None, creates a new figure and displays it).
+      Repeated calls with the same Axes update the existing lines in place using blitting.
     """
-    fig, ax = plt.subplots(figsize=figsize)
+    if ax is not None and _position_artists(ax) is not None:
+        _update_driver_positions(ax, lap_data, driver_colors)
+        return
 
-    drivers = lap_data['Driver'].unique()
-    for driver in drivers:
-        drv_laps = lap_data[lap_data['Driver'] == driver]
-        
-        if drv_laps.empty:
-            continue  # Skip if no lap data for driver
+    interactive = ax is not None
+    fig, ax, _ = _prepare_axes(ax, figsize)
 
+    # Only animate the lines if the canvas can restore a saved background
+    blit = interactive and fig.canvas.supports_blit
+
+    lines = {}
+    # Group the rows once instead of re-filtering the whole DataFrame for every driver
+    columns = _as_soa(lap_data, ['LapNumber', 'Position'])
+    for driver, rows in _driver_rows(lap_data['Driver']).items():
         color = driver_colors.get(driver, 'black')  # Use black as default if no color is specified
 
-        ax.plot(drv_laps['LapNumber'], drv_laps['Position'], label=driver, color=color)
+        lines[driver], = ax.plot(columns['LapNumber'][rows], columns['Position'][rows],
+                                 label=driver, color=color, animated=blit)
 
     ax.set_ylim([20.5, 0.5])  # Adjust as necessary for the number of drivers
     ax.set_yticks([1, 5, 10, 15, 20])
@@ -138,12 +338,19 @@ def plot_driver_positions(lap_data, driver_colors, title="Race Position Changes"
     if labels:
         ax.legend(handles=handles, bbox_to_anchor=(1.05, 1), loc='upper left')
 
-    plt.title(title)
-    plt.tight_layout()
-    plt.show()
+    ax.set_title(title)
+    fig.tight_layout()
+
+    if not interactive:
+        plt.show()
+        return
 
+    draw_cid = fig.canvas.mpl_connect('draw_event', lambda event: _on_position_draw(ax, event)) if blit else None
+    setattr(ax, _POSITION_ARTISTS_ATTR, {'lines': lines, 'background': None, 'blit': blit, 'draw_cid': draw_cid})
+    fig.canvas.draw()
 
-def plot_tyre_strategy(drivers, stints, driver_colors, compound_colors, title="Tyre Strategy", figsize=(10, 5)):
+
+def plot_tyre_strategy(drivers, stints, driver_colors, compound_colors, title="Tyre Strategy", figsize=(10, 5), ax=None):
     """
     Plots the tyre strategies for each driver in a session.
     
@@ -154,28 +361,39 @@ def plot_tyre_strategy(drivers, stints, driver_colors, compound_colors, title="T
     - compound_colors: dict, mapping of compound names to colors
     - title: str, the title of the plot (default: "Tyre Strategy")
     - figsize: tuple, the dimensions of the figure (default: (10, 5))
+    - ax: matplotlib Axes to draw on, cleared before plotting (default: None, creates a new figure and displays it)
     """
     
-    fig, ax = plt.subplots(figsize=figsize)
+    fig, ax, show = _prepare_axes(ax, figsize)
 
-    for driver in drivers:
-        driver_stints = stints.loc[stints["Driver"] == driver]
+    lengths_all = stints["StintLength"].to_numpy()
+    stint_rows = _driver_rows(stints["Driver"])
 
-        previous_stint_end = 0  # Reset the stint end marker for each driver
+    # Look up the color of each distinct compound once, the trailing gray is used for missing compounds (code -1)
+    compound_codes, compound_names = pd.factorize(stints["Compound"])
+    palette = np.empty(len(compound_names) + 1, dtype=object)
+    palette[:] = [compound_colors.get(c, 'gray') for c in compound_names] + ['gray']  # Default to gray if no color is found
 
-        for idx, row in driver_stints.iterrows():
-            ax.barh(
-                y=driver,
-                width=row["StintLength"],
-                left=previous_stint_end,
-                color=compound_colors.get(row["Compound"], 'gray'),  # Default to gray if no color is found
-                edgecolor="black",
-                fill=True
-            )
-            previous_stint_end += row["StintLength"]
+    for driver in drivers:
+        rows = stint_rows.get(driver, np.empty(0, dtype=np.intp))
+        lengths = lengths_all[rows]
+
+        # Each stint starts where the previous one ended
+        lefts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        colors = palette[compound_codes[rows]].tolist()
+
+        # Draw all stints of the driver in a single call
+        ax.barh(
+            y=[driver] * len(lengths),
+            width=lengths,
+            left=lefts,
+            color=colors,
+            edgecolor="black",
+            fill=True
+        )
 
-    plt.title(title)
-    plt.xlabel("Lap Number")
+    ax.set_title(title)
+    ax.set_xlabel("Lap Number")
 
     ax.xaxis.grid(True)  # Enable the grid for x-axis
     ax.yaxis.grid(False)  # Disable the grid for y-axis
@@ -186,11 +404,151 @@ def plot_tyre_strategy(drivers, stints, driver_colors, compound_colors, title="T
     ax.spines['right'].set_visible(False)
     ax.spines['left'].set_visible(False)
 
-    plt.tight_layout()
-    plt.show()
+    fig.tight_layout()
+    if show:
+        plt.show()
+
+
+def _assign_stints(lap_numbers, stint_lengths, current_stints):
+    """
+    Computes the stint number of each lap from the lengths of consecutive stints.
+
+    Parameters:
+    - lap_numbers: array of lap numbers, starting at 1
+    - stint_lengths: array of stint lengths in laps, in stint order
+    - current_stints: array with the existing stint number of each lap
+
+    Returns:
+    - array with the 1-based stint number of each lap covered by the stints, other laps keep their current stint
+    """
+    edges = np.cumsum(stint_lengths)  # Last lap number of each stint
+    stint_numbers = np.searchsorted(edges, np.asarray(lap_numbers) - 1, side='right') + 1
+    return np.where(stint_numbers <= len(edges), stint_numbers, current_stints)
+
+
+# Parquet metadata entry holding the session and stints a driver laps cache was prepared from
+_CACHE_KEY_FIELD = b'fastf1_util.driver_laps_key'
+# Parquet metadata field listing the requested drivers that had no laps, as a JSON list
+_CACHE_NO_LAPS_FIELD = b'fastf1_util.drivers_without_laps'
+
 
+def _categorize_driver_laps(driver_laps, drivers):
+    """
+    Stores driver codes and tyre compounds as categoricals so grouping works on integer codes.
+
+    Parameters:
+    - driver_laps: DataFrame with 'Driver' and 'Compound' columns, modified in place
+    - drivers: list of driver codes, used as the driver categories in this order
+    """
+    # Drop drivers without laps, so they neither show up in legends nor take a palette color
+    driver_laps['Driver'] = pd.Categorical(driver_laps['Driver'], categories=list(dict.fromkeys(drivers))).remove_unused_categories()
+    extra_compounds = sorted(set(driver_laps['Compound'].dropna()) - set(_COMPOUND_ORDER))
+    driver_laps['Compound'] = pd.Categorical(driver_laps['Compound'], categories=_COMPOUND_ORDER + extra_compounds)
+
+
+def _driver_laps_cache_key(session, stints):
+    """
+    Builds the key identifying the session and stints that prepared driver laps come from.
+
+    Parameters:
+    - session: FastF1 session object containing the race data
+    - stints: DataFrame containing stint information for drivers
 
-def prepare_driver_laps(session, drivers, stints):
+    Returns:
+    - bytes, the key stored in the metadata of the Parquet cache file
+    """
+    stint_hashes = pd.util.hash_pandas_object(stints[['Driver', 'StintLength']].astype(str), index=False)
+    stints_digest = hashlib.sha1(stint_hashes.to_numpy().tobytes()).hexdigest()
+    return f"{session.api_path}|{stints_digest}".encode()
+
+
+def _cached_metadata(cache_path):
+    """
+    Reads the key of a Parquet cache file and the drivers it recorded as having no laps.
+
+    Parameters:
+    - cache_path: str, path of the Parquet file written by _write_driver_laps_cache
+
+    Returns:
+    - Tuple of the key of the file as bytes and the set of driver codes without laps,
+      the key is None if the file is missing or has no key
+    """
+    if not os.path.exists(cache_path):
+        return None, set()
+
+    import pyarrow.parquet as pq
+
+    metadata = pq.read_schema(cache_path).metadata or {}
+    return metadata.get(_CACHE_KEY_FIELD), set(json.loads(metadata.get(_CACHE_NO_LAPS_FIELD, b'[]')))
+
+
+def _read_driver_laps_cache(cache_path, drivers, key):
+    """
+    Loads prepared driver laps from a Parquet cache file.
+
+    Parameters:
+    - cache_path: str, path of the Parquet file written by _write_driver_laps_cache
+    - drivers: list of driver codes to load
+    - key: bytes, key of the session and stints the laps must have been prepared from
+
+    Returns:
+    - DataFrame with the cached laps of the requested drivers in the requested order,
+      or None if the file is missing, was prepared from other data or lacks a driver
+    """
+    cached_key, drivers_without_laps = _cached_metadata(cache_path)
+    if cached_key != key:
+        return None
+
+    import pyarrow.parquet as pq
+
+    # Driver codes are stored as strings, each driver in its own row group,
+    # so only the row groups of the requested drivers are read from disk
+    driver_names = [str(driver) for driver in drivers]
+    driver_laps = pq.read_table(cache_path, filters=[('Driver', 'in', driver_names)]).to_pandas()
+    if not set(driver_names).issubset(set(driver_laps['Driver'].unique()) | drivers_without_laps):
+        return None
+
+    # Restore the driver codes as passed in and order the laps like the drivers argument
+    driver_laps['Driver'] = driver_laps['Driver'].astype(str).map(dict(zip(driver_names, drivers)))
+    _categorize_driver_laps(driver_laps, drivers)
+    order = np.argsort(driver_laps['Driver'].cat.codes.to_numpy(), kind='stable')
+    return driver_laps.iloc[order].reset_index(drop=True)
+
+
+def _write_driver_laps_cache(driver_laps, drivers, cache_path, key):
+    """
+    Saves prepared driver laps to a zstd-compressed Parquet file with dictionary-encoded Driver and Compound columns,
+    writing one row group per driver. Laps of other drivers already cached for the same session and stints are kept.
+
+    Parameters:
+    - driver_laps: DataFrame returned by prepare_driver_laps
+    - drivers: list of driver codes the laps were prepared for, drivers without laps are recorded in the metadata
+    - cache_path: str, path of the Parquet file to write
+    - key: bytes, key of the session and stints the laps were prepared from
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    driver_laps = driver_laps.astype({'Driver': str, 'Compound': object})
+    driver_names = [str(driver) for driver in drivers]
+    drivers_without_laps = set(driver_names) - set(driver_laps['Driver'].unique())
+
+    cached_key, cached_drivers_without_laps = _cached_metadata(cache_path)
+    if cached_key == key:
+        other_laps = pq.read_table(cache_path, filters=[('Driver', 'not in', driver_names)]).to_pandas()
+        driver_laps = pd.concat([other_laps.astype({'Driver': str, 'Compound': object}), driver_laps], ignore_index=True)
+        drivers_without_laps |= cached_drivers_without_laps - set(driver_names)
+
+    table = pa.Table.from_pandas(driver_laps, preserve_index=False)
+    table = table.replace_schema_metadata({**(table.schema.metadata or {}),
+                                           _CACHE_KEY_FIELD: key,
+                                           _CACHE_NO_LAPS_FIELD: json.dumps(sorted(drivers_without_laps)).encode()})
+    with pq.ParquetWriter(cache_path, table.schema, compression='zstd', use_dictionary=['Driver', 'Compound']) as writer:
+        for rows in _driver_rows(driver_laps['Driver']).values():
+            writer.write_table(table.take(rows))
+
+
+def prepare_driver_laps(session, drivers, stints, cache_path=None):
     """
     Prepares a DataFrame with lap times and stint information for each driver.
     
@@ -198,45 +556,90 @@ def prepare_driver_laps(session, drivers, stints):
     - session: FastF1 session object containing the race data
     - drivers: list of driver codes
     - stints: DataFrame containing stint information for drivers
+    - cache_path: str, Parquet file used to cache the result between calls, requires pyarrow (default: None).
+      The file is tied to the session and stints it was prepared from and is rebuilt when either changes.
     
     Returns:
-    - DataFrame with combined lap times and stint information for all drivers
+    - DataFrame with combined lap times (including 'LapTime (s)') and stint information for all drivers
     """
-    driver_laps_list = []
+    if cache_path is not None:
+        cache_key = _driver_laps_cache_key(session, stints)
+        cached_laps = _read_driver_laps_cache(cache_path, drivers, cache_key)
+        if cached_laps is not None:
+            # Return the same Laps type as a freshly prepared result
+            return type(session.laps)(cached_laps, session=session)
+
+    # Filter the session laps once for all requested drivers and group them by driver
+    all_laps = session.laps.pick_drivers(drivers)
+    grouped_laps = all_laps.groupby('Driver', sort=False)
+
+    # Collect the stint lengths of every driver in a single pass
+    all_stint_lengths = stints["StintLength"].to_numpy()
+    stint_lengths = {driver: all_stint_lengths[rows] for driver, rows in _driver_rows(stints["Driver"]).items()}
+
+    # Drivers may be given as abbreviations or driver numbers, as accepted by pick_drivers()
+    driver_ids = all_laps[['Driver', 'DriverNumber']].drop_duplicates()
+    abbreviations = dict(zip(driver_ids['Driver'], driver_ids['Driver']))
+    abbreviations.update(zip(driver_ids['DriverNumber'], driver_ids['Driver']))
+
+    # Select the quick laps of every driver, the threshold is relative to each driver's own fastest lap
+    quick_lap_labels = []
+    row_drivers = []
     for driver in drivers:
-        driver_laps = session.laps.pick_drivers(driver).pick_quicklaps().reset_index(drop=True)
-        driver_laps['Driver'] = driver  # Add a column for the driver code
+        abbreviation = abbreviations.get(str(driver))
+        if abbreviation is None:
+            continue  # No laps for this driver
 
-        # Get stint information for the driver
-        driver_stints = stints.loc[stints["Driver"] == driver]
-        stint_lengths = driver_stints["StintLength"].tolist()
+        labels = grouped_laps.get_group(abbreviation).pick_quicklaps().index
+        quick_lap_labels.append(labels)
+        row_drivers.extend([driver] * len(labels))
 
-        # Assign stint number to each lap based on stint length
-        start_lap = 1
-        for stint_number, stint_length in enumerate(stint_lengths, start=1):
-            end_lap = start_lap + stint_length - 1
-            driver_laps.loc[(driver_laps['LapNumber'] >= start_lap) & (driver_laps['LapNumber'] <= end_lap), 'Stint'] = stint_number
-            start_lap = end_lap + 1  # Next stint starts after the last lap of the current stint
+    if quick_lap_labels:
+        all_driver_laps = all_laps.loc[np.concatenate(quick_lap_labels)].reset_index(drop=True)
+    else:
+        all_driver_laps = all_laps.iloc[0:0].reset_index(drop=True)  # No laps for any driver
+    all_driver_laps['Driver'] = row_drivers  # Use the driver codes as passed in
+
+    # Assign stint number to each lap based on stint length, updating one copy of the stint column driver by driver
+    lap_numbers = all_driver_laps['LapNumber'].to_numpy()
+    if 'Stint' in all_driver_laps.columns:
+        stint_numbers = all_driver_laps['Stint'].to_numpy(dtype=float, copy=True)
+    else:
+        stint_numbers = np.full(len(all_driver_laps), np.nan)
+    for driver, rows in _driver_rows(all_driver_laps['Driver']).items():
+        stint_numbers[rows] = _assign_stints(lap_numbers[rows], stint_lengths.get(driver, np.empty(0)),
+                                             stint_numbers[rows])
+    all_driver_laps['Stint'] = stint_numbers
+
+    _categorize_driver_laps(all_driver_laps, drivers)
 
-        driver_laps_list.append(driver_laps)
+    # Convert LapTime to seconds once so downstream plots can reuse it (NaT becomes NaN)
+    all_driver_laps['LapTime (s)'] = all_driver_laps['LapTime'].values / np.timedelta64(1, 's')
 
-    # Concatenate all dataframes in the list
-    return pd.concat(driver_laps_list, ignore_index=True)
+    if cache_path is not None:
+        _write_driver_laps_cache(all_driver_laps, drivers, cache_path, cache_key)
+
+    return all_driver_laps
     
     
-def plot_driver_laps(session, drivers, stints, title='Lap time comparison of each stint'):
+def plot_driver_laps(session, drivers, stints, title='Lap time comparison of each stint', cache_path=None, ax=None):
     """
     Plots the lap times for drivers across their stints.
     
     Parameters:
-    - all_driver_laps: DataFrame containing lap times, driver identifiers, and stint numbers
+    - session: FastF1 session object containing the race data
+    - drivers: list of driver codes
+    - stints: DataFrame containing stint information for drivers
+    - title: str, the title of the plot (default: 'Lap time comparison of each stint')
+    - cache_path: str, Parquet file used to cache the prepared laps, requires pyarrow (default: None)
+    - ax: matplotlib Axes to draw on, cleared before plotting (default: None, creates a new figure and displays it)
     
     Returns:
     - None: Displays the plot.
     """
-    all_driver_laps = prepare_driver_laps(session, drivers, stints)
+    all_driver_laps = prepare_driver_laps(session, drivers, stints, cache_path=cache_path)
 
-    fig, ax = plt.subplots(figsize=(14, 10))
+    fig, ax, show = _prepare_axes(ax, (14, 10))
     sns.lineplot(data=all_driver_laps,
                  x="LapNumber",
                  y="LapTime",
@@ -254,4 +657,5 @@ def plot_driver_laps(session, drivers, stints, title='Lap time comparison of eac
     handles, labels = ax.get_legend_handles_labels()
     ax.legend(handles=handles, labels=labels, title='Driver and Stint', loc='upper right')
 
-    plt.show()
+    if show:
+        plt.show()